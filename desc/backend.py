@@ -70,13 +70,13 @@ if use_jax:  # noqa: C901 - FIXME: simplify this, define globally and then assig
 
     imap = jax.lax.map
     from jax.experimental.ode import odeint
-    from jax.lax import cond, fori_loop, scan, switch, while_loop
+    from jax.lax import cond, fori_loop, rsqrt, scan, switch, top_k, while_loop
     from jax.nn import softmax as softargmax
     from jax.numpy import bincount, flatnonzero, repeat, take
     from jax.numpy.fft import irfft, rfft, rfft2
     from jax.scipy.fft import dct, idct
     from jax.scipy.linalg import block_diag, cho_factor, cho_solve, qr, solve_triangular
-    from jax.scipy.special import gammaln, logsumexp
+    from jax.scipy.special import digamma, gammaln, logsumexp
     from jax.tree_util import (
         register_pytree_node,
         tree_flatten,
@@ -418,7 +418,7 @@ else:  # pragma: no cover
         qr,
         solve_triangular,
     )
-    from scipy.special import gammaln, logsumexp  # noqa: F401
+    from scipy.special import digamma, gammaln, logsumexp  # noqa: F401
     from scipy.special import softmax as softargmax  # noqa: F401
 
     trapezoid = np.trapezoid if hasattr(np, "trapezoid") else np.trapz
@@ -685,6 +685,15 @@ else:  # pragma: no cover
             minlength = max(minlength, length)
         return np.bincount(x, weights, minlength)[:length]
 
+    def top_k(operand, k):
+        """A numpy implementation of jax.lax.top_k."""
+        idx = np.argsort(-operand, axis=-1, kind="stable")[..., :k]
+        return np.take_along_axis(operand, idx, axis=-1), idx
+
+    def rsqrt(x):
+        """A numpy implementation of jax.lax.rsqrt."""
+        return 1 / np.sqrt(x)
+
     def repeat(a, repeats, axis=None, total_repeat_length=None):
         """A numpy implementation of jnp.repeat."""
         out = np.repeat(a, repeats, axis)
@@ -2,6 +2,8 @@
 
 from functools import partial
 
+import numpy as np
+
 from desc.backend import flatnonzero, jnp, put
 from desc.utils import setdefault
 
@@ -71,9 +73,9 @@ def _plot_intersect(ax, legend, z1, z2, k, k_transparency, klabel):
     if k is None:
         return
 
-    k = jnp.atleast_1d(jnp.squeeze(k))
+    k = np.atleast_1d(np.squeeze(k))
     assert k.ndim == 1
-    z1, z2 = jnp.atleast_2d(z1, z2)
+    z1, z2 = np.atleast_2d(z1, z2)
     assert z1.ndim == z2.ndim >= 2
     assert k.shape[0] == z1.shape[0] == z2.shape[0]
     for p in k:
@@ -91,7 +93,7 @@ def _plot_intersect(ax, legend, z1, z2, k, k_transparency, klabel):
             legend,
             ax.scatter(
                 _z1,
-                jnp.full_like(_z1, k[i]),
+                np.full_like(_z1, k[i]),
                 marker="v",
                 color="tab:red",
                 label=r"$z_1$",
@@ -101,7 +103,7 @@ def _plot_intersect(ax, legend, z1, z2, k, k_transparency, klabel):
             legend,
             ax.scatter(
                 _z2,
-                jnp.full_like(_z2, k[i]),
+                np.full_like(_z2, k[i]),
                 marker="^",
                 color="tab:green",
                 label=r"$z_2$",
@@ -3,7 +3,7 @@
 from interpax import CubicHermiteSpline, PPoly
 from orthax.legendre import leggauss
 
-from desc.backend import jnp
+from desc.backend import jit, jnp
 from desc.integrals.bounce_utils import (
     _bounce_quadrature,
     _check_bounce_points,
@@ -22,6 +22,10 @@ from desc.integrals.quad_utils import (
 from desc.io import IOAble
 from desc.utils import errorif, setdefault, warnif
 
+# Bounce points are typically recomputed for many sets of pitch angles with the
+# same shapes, so compile once per shape rather than dispatching op by op.
+_bounce_points = jit(bounce_points, static_argnames=["num_well", "check", "plot"])
+
 
 class Bounce1D(IOAble):
     """Computes bounce integrals using one-dimensional local spline methods.
@@ -193,9 +197,23 @@ class Bounce1D(IOAble):
         )
         self._dB_dz = polyder_vec(self.B)
 
-        # Add axis here instead of in ``_bounce_quadrature``.
-        for name in self._data:
-            self._data[name] = self._data[name][..., jnp.newaxis, :]
+        # These do not depend on the pitch angle, so compute them once here
+        # rather than every time the bounce integrals are evaluated. The splines
+        # interpolated to the quadrature points are stored in one buffer with a
+        # trailing axis enumerating them.
+        B = self._data["|B|"]
+        B_z = self._data["|B|_z|r,a"]
+        B_sup_z = self._data["B^zeta"]
+        self._data = {
+            "B^zeta/|B|, |B|": jnp.stack([B_sup_z / B, B], axis=-1),
+            "(B^zeta/|B|, |B|)_z|r,a": jnp.stack(
+                [
+                    self._data["B^zeta_z|r,a"] / B - B_sup_z * B_z / B**2,
+                    B_z,
+                ],
+                axis=-1,
+            ),
+        }
 
     @staticmethod
     def reshape_data(grid, *arys):
@@ -252,7 +270,9 @@ class Bounce1D(IOAble):
             line and pitch, is padded with zero.
 
         """
-        return bounce_points(pitch_inv, self._zeta, self.B, self._dB_dz, num_well)
+        return _bounce_points(
+            pitch_inv, self._zeta, self.B, self._dB_dz, num_well=num_well
+        )
 
     def check_points(self, points, pitch_inv, *, plot=True, **kwargs):
         """Check that bounce points are computed correctly.
@@ -301,12 +321,16 @@ class Bounce1D(IOAble):
         *,
         method="cubic",
         batch=True,
+        pitch_chunk=None,
         check=False,
         plot=False,
     ):
         """Bounce integrate ∫ f(λ, ℓ) dℓ.
 
         Computes the bounce integral ∫ f(λ, ℓ) dℓ for every field line and pitch.
+        This method is not compiled on its own, since ``integrand`` is typically a
+        new closure on each call. To reuse compiled code across calls, wrap the
+        calling function in ``jit`` where the integrand is fixed.
 
         Parameters
         ----------
@@ -345,6 +369,10 @@ class Bounce1D(IOAble):
             Default is cubic C1 local spline.
         batch : bool
             Whether to perform computation in a batched manner. Default is true.
+        pitch_chunk : int
+            If given, loop over chunks of this many pitch values so that peak memory
+            of the intermediate arrays scales with ``pitch_chunk`` instead of
+            ``num_pitch``. Default is to compute all pitch values at once.
         check : bool
             Flag for debugging. Must be false for JAX transformations.
         plot : bool
@@ -372,6 +400,7 @@ class Bounce1D(IOAble):
             knots=self._zeta,
             method=method,
             batch=batch,
+            pitch_chunk=pitch_chunk,
             check=check,
             plot=plot,
         )
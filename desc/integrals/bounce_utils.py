@@ -4,11 +4,12 @@ import numpy as np
 from interpax import PPoly
 from matplotlib import pyplot as plt
 
-from desc.backend import imap, jnp, softargmax
+from desc.backend import imap, jnp, softargmax, top_k
 from desc.integrals.basis import _add2legend, _in_epigraph_and, _plot_intersect
 from desc.integrals.interp_utils import (
     interp1d_Hermite_vec,
     interp1d_vec,
+    interp1d_vec_stack,
     polyroot_vec,
     polyval_vec,
 )
@@ -17,14 +18,7 @@ from desc.integrals.quad_utils import (
     grad_bijection_from_disc,
     uniform,
 )
-from desc.utils import (
-    atleast_nd,
-    errorif,
-    flatten_matrix,
-    is_broadcastable,
-    setdefault,
-    take_mask,
-)
+from desc.utils import atleast_nd, errorif, flatten_matrix, is_broadcastable, setdefault
 
 
 def get_pitch_inv_quad(min_B, max_B, num_pitch):
@@ -190,12 +184,10 @@ def bounce_points(
 
     # Transform out of local power basis expansion.
     intersect = flatten_matrix(intersect + knots[:-1, jnp.newaxis])
-    # New versions of JAX only like static sentinels.
-    sentinel = -10000000.0  # instead of knots[0] - 1
-    z1 = take_mask(intersect, is_z1, size=num_well, fill_value=sentinel)
-    z2 = take_mask(intersect, is_z2, size=num_well, fill_value=sentinel)
+    z1 = _pack(intersect, is_z1, num_well)
+    z2 = _pack(intersect, is_z2, num_well)
 
-    mask = (z1 > sentinel) & (z2 > sentinel)
+    mask = jnp.isfinite(z1) & jnp.isfinite(z2)
     # Set outside mask to same value so integration is over set of measure zero.
     z1 = jnp.where(mask, z1, 0.0)
     z2 = jnp.where(mask, z2, 0.0)
@@ -206,6 +198,42 @@ def bounce_points(
     return z1, z2
 
 
+def _pack(z, mask, size=None):
+    """Return the first ``size`` elements of ``z[mask]`` padded with infinity.
+
+    Parameters
+    ----------
+    z : jnp.ndarray
+        Shape (..., n).
+        Coordinates which are increasing along the last axis where ``mask`` is true.
+    mask : jnp.ndarray
+        Shape z.shape.
+        Boolean array indicating which elements to keep.
+    size : int or None
+        Size of last axis of the returned array. Default is ``n``.
+
+    Returns
+    -------
+    z : jnp.ndarray
+        Shape (..., size).
+
+    """
+    # Since the elements to keep are already ordered, sorting them before the
+    # rest packs them in a single pass over the last axis of ``z``.
+    z = jnp.where(mask, z, jnp.inf)
+    if size is None or size >= z.shape[-1]:
+        z = jnp.sort(z, axis=-1)
+        if size is None:
+            return z
+        return jnp.pad(
+            z,
+            [(0, 0)] * (z.ndim - 1) + [(0, size - z.shape[-1])],
+            constant_values=jnp.inf,
+        )
+    # Partial selection of the smallest elements, returned in ascending order.
+    return -top_k(-z, size)[0]
+
+
 def _set_default_plot_kwargs(kwargs):
     kwargs.setdefault(
         "title",
@@ -224,24 +252,29 @@ def _check_bounce_points(z1, z2, pitch_inv, knots, B, plot=True, **kwargs):
     plots = []
 
     assert z1.shape == z2.shape
-    z1 = atleast_nd(4, z1)
-    z2 = atleast_nd(4, z2)
-    pitch_inv = atleast_nd(3, pitch_inv)
-    B = atleast_nd(4, B)
+    # This is a diagnostic that loops in Python, so convert to NumPy once
+    # rather than dispatching JAX operations for every field line and pitch.
+    z1 = np.asarray(atleast_nd(4, z1))
+    z2 = np.asarray(atleast_nd(4, z2))
+    B = np.asarray(atleast_nd(4, B))
+    pitch_inv = np.broadcast_to(
+        atleast_nd(3, pitch_inv), (*B.shape[:-2], np.shape(pitch_inv)[-1])
+    )
+    knots = np.asarray(knots)
     mask = (z1 - z2) != 0.0
-    z1 = jnp.where(mask, z1, jnp.nan)
-    z2 = jnp.where(mask, z2, jnp.nan)
+    z1 = np.where(mask, z1, np.nan)
+    z2 = np.where(mask, z2, np.nan)
 
-    err_1 = jnp.any(z1 > z2, axis=-1)
-    err_2 = jnp.any(z1[..., 1:] < z2[..., :-1], axis=-1)
+    err_1 = np.any(z1 > z2, axis=-1)
+    err_2 = np.any(z1[..., 1:] < z2[..., :-1], axis=-1)
 
-    eps = kwargs.pop("eps", jnp.finfo(jnp.array(1.0).dtype).eps * 10)
+    eps = kwargs.pop("eps", np.finfo(jnp.array(1.0).dtype).eps * 10)
     for ml in np.ndindex(B.shape[:-2]):
         ppoly = PPoly(B[ml].T, knots)
         for p in range(pitch_inv.shape[-1]):
             idx = (*ml, p)
-            B_midpoint = ppoly((z1[idx] + z2[idx]) / 2)
-            err_3 = jnp.any(B_midpoint > pitch_inv[idx] + eps)
+            B_midpoint = np.asarray(ppoly((z1[idx] + z2[idx]) / 2))
+            err_3 = np.any(B_midpoint > pitch_inv[idx] + eps)
             if not (err_1[idx] or err_2[idx] or err_3):
                 continue
             _z1 = z1[idx][mask[idx]]
@@ -257,7 +290,7 @@ def _check_bounce_points(z1, z2, pitch_inv, knots, B, plot=True, **kwargs):
                 )
 
             print("      z1    |    z2")
-            print(jnp.column_stack([_z1, _z2]))
+            print(np.column_stack([_z1, _z2]))
             assert not err_1[idx], "Intersects have an inversion.\n"
             assert not err_2[idx], "Detected discontinuity.\n"
             assert not err_3, (
@@ -290,6 +323,7 @@ def _bounce_quadrature(
     *,
     method="cubic",
     batch=True,
+    pitch_chunk=None,
     check=False,
     plot=False,
 ):
@@ -322,9 +356,11 @@ def _bounce_quadrature(
         Real scalar-valued functions evaluated on the ``knots``.
         These functions should be arguments to the callable ``integrand``.
     data : dict[str, jnp.ndarray]
-        Shape (..., 1, N).
+        Shape (..., N, 2).
         Required data evaluated on ``grid`` and reshaped with ``Bounce1D.reshape_data``.
-        Must include names in ``Bounce1D.required_names``.
+        Must include ``B^zeta/|B|, |B|`` and ``(B^zeta/|B|, |B|)_z|r,a``, which stack
+        B^ζ/|B| and |B| and their derivatives on the last axis, as stored by
+        ``Bounce1D``.
     knots : jnp.ndarray
         Shape (N, ).
         Unique ζ coordinates where the arrays in ``data`` and ``f`` were evaluated.
@@ -334,9 +370,13 @@ def _bounce_quadrature(
         Default is cubic C1 local spline.
     batch : bool
         Whether to perform computation in a batched manner. Default is true.
+    pitch_chunk : int
+        If given, loop over chunks of this many pitch values so that peak memory
+        of the intermediate arrays scales with ``pitch_chunk`` instead of
+        ``num_pitch``. Default is to compute all pitch values at once.
     check : bool
         Flag for debugging. Must be false for JAX transformations.
-        Ignored if ``batch`` is false.
+        Ignored if ``batch`` is false or ``pitch_chunk`` is given.
     plot : bool
         Whether to plot the quantities in the integrand interpolated to the
         quadrature points of each integral. Ignored if ``check`` is false.
@@ -356,6 +396,43 @@ def _bounce_quadrature(
     if not isinstance(f, (list, tuple)):
         f = [f] if isinstance(f, (jnp.ndarray, np.ndarray)) else list(f)
 
+    num_pitch, num_well = z1.shape[-2:]
+    if pitch_chunk is not None and pitch_chunk < num_pitch:
+        pad = -num_pitch % pitch_chunk
+
+        def split(a):  # over num pitch axis, which must be last
+            # Repeat the last pitch rather than padding with zeros, which would
+            # give infinite pitch and empty bounce intervals with nan gradients.
+            a = jnp.pad(a, [(0, 0)] * (a.ndim - 1) + [(0, pad)], mode="edge")
+            return jnp.moveaxis(a.reshape(*a.shape[:-1], -1, pitch_chunk), -2, 0)
+
+        def loop(args):  # over chunks of num pitch axis
+            pitch_inv, z1, z2 = args
+            return _bounce_quadrature(
+                x=x,
+                w=w,
+                integrand=integrand,
+                points=(jnp.swapaxes(z1, -1, -2), jnp.swapaxes(z2, -1, -2)),
+                pitch_inv=pitch_inv,
+                f=f,
+                data=data,
+                knots=knots,
+                method=method,
+                batch=batch,
+            )
+
+        result = imap(
+            loop,
+            (
+                split(jnp.broadcast_to(pitch_inv, z1.shape[:-1])),
+                split(jnp.swapaxes(z1, -1, -2)),
+                split(jnp.swapaxes(z2, -1, -2)),
+            ),
+        )
+        return jnp.moveaxis(result, 0, -3).reshape(*z1.shape[:-2], -1, num_well)[
+            ..., :num_pitch, :
+        ]
+
     # Integrate and complete the change of variable.
     if batch:
         result = _interpolate_and_integrate(
@@ -432,26 +509,47 @@ def _interpolate_and_integrate(
     """
     assert w.ndim == 1 and Q.shape[-1] == w.size
     assert Q.shape[-3 + (not batch)] == pitch_inv.shape[-1]
-    assert data["|B|"].shape[-1] == knots.size
+    assert data["B^zeta/|B|, |B|"].shape[-2] == knots.size
 
     shape = Q.shape
-    if batch:
-        Q = flatten_matrix(Q)
-    b_sup_z = interp1d_Hermite_vec(
-        Q,
-        knots,
-        data["B^zeta"] / data["|B|"],
-        data["B^zeta_z|r,a"] / data["|B|"]
-        - data["B^zeta"] * data["|B|_z|r,a"] / data["|B|"] ** 2,
+    # Flatten the pitch, well, and quadrature axes into one axis of points so
+    # that the interpolation runs over a single contiguous axis per field line.
+    num_flat = 2 + batch
+    Q = Q.reshape(*shape[:-num_flat], -1)
+    # Interpolate both splines in one pass as they share knots and points.
+    b_sup_z, B = jnp.moveaxis(
+        interp1d_Hermite_vec(
+            Q,
+            knots,
+            data["B^zeta/|B|, |B|"],
+            data["(B^zeta/|B|, |B|)_z|r,a"],
+        ).reshape(*shape, 2),
+        source=-1,
+        destination=0,
     )
-    B = interp1d_Hermite_vec(Q, knots, data["|B|"], data["|B|_z|r,a"])
     # Spline each function separately so that operations in the integrand
-    # that do not preserve smoothness can be captured.
-    f = [interp1d_vec(Q, knots, f_i[..., jnp.newaxis, :], method=method) for f_i in f]
-    result = (
-        (integrand(*f, B=B, pitch=1 / pitch_inv[..., jnp.newaxis]) / b_sup_z)
-        .reshape(shape)
-        .dot(w)
+    # that do not preserve smoothness can be captured. The splines are stacked
+    # so that all functions are interpolated in one pass.
+    if f:
+        f = list(
+            jnp.moveaxis(
+                interp1d_vec_stack(
+                    Q,
+                    knots,
+                    jnp.stack(jnp.broadcast_arrays(*f), axis=-1),
+                    method=method,
+                ).reshape(*shape, len(f)),
+                source=-1,
+                destination=0,
+            )
+        )
+    pitch = 1 / pitch_inv.reshape(*pitch_inv.shape, *(1,) * (num_flat - 1))
+    # Divide by B^ζ/|B| and apply the weights in one reduction.
+    result = jnp.einsum(
+        "...q,...q,q->...",
+        integrand(*f, B=B, pitch=pitch),
+        jnp.reciprocal(b_sup_z),
+        w,
     )
     if check:
         _check_interp(shape, Q, b_sup_z, B, result, f, plot)
@@ -651,9 +749,9 @@ def interp_to_argmin(
         beta * _where_for_argmin(z1, z2, ext, g_ext, upper_sentinel),
         axis=-1,
     )
-    h = jnp.linalg.vecdot(
-        argmin,
-        interp1d_vec(ext, knots, h, method=method)[..., jnp.newaxis, jnp.newaxis, :],
+    # Contract over the extrema axis without broadcasting h over pitch and wells.
+    h = jnp.einsum(
+        "...pwe,...e->...pw", argmin, interp1d_vec(ext, knots, h, method=method)
     )
     assert h.shape == z1.shape
     return h
@@ -799,12 +897,12 @@ def plot_ppoly(
                 ),
             )
 
-    z = jnp.linspace(
+    z = np.linspace(
         start=setdefault(start, ppoly.x[0]),
         stop=setdefault(stop, ppoly.x[-1]),
         num=num,
     )
-    _add2legend(legend, ax.plot(z, ppoly(z), label=vlabel))
+    _add2legend(legend, ax.plot(z, np.asarray(ppoly(z)), label=vlabel))
     _plot_intersect(
         ax=ax,
         legend=legend,
@@ -7,8 +7,9 @@ methods that have the best (asymptotic) algorithmic complexity.
 For example, we prefer to not use Horner's method.
 """
 
-from functools import partial
+from functools import lru_cache, partial
 
+import numpy as np
 from interpax import interp1d
 
 from desc.backend import jnp
@@ -18,11 +19,20 @@ from desc.utils import safediv
 interp1d_vec = jnp.vectorize(
     interp1d, signature="(m),(n),(n)->(m)", excluded={"method"}
 )
+# Same as above, but the last axis of f enumerates functions that share the knots
+# and are interpolated to the same points in a single pass.
+interp1d_vec_stack = jnp.vectorize(
+    interp1d, signature="(m),(n),(n,k)->(m,k)", excluded={"method"}
+)
 
 
-@partial(jnp.vectorize, signature="(m),(n),(n),(n)->(m)")
+@partial(jnp.vectorize, signature="(m),(n),(n,k),(n,k)->(m,k)")
 def interp1d_Hermite_vec(xq, x, f, fx, /):
-    """Vectorized cubic Hermite spline."""
+    """Vectorized cubic Hermite spline.
+
+    The last axis of ``f`` and ``fx`` enumerates functions that share the knots
+    ``x`` and are interpolated to the same points ``xq`` in a single pass.
+    """
     return interp1d(xq, x, f, method="cubic", fx=fx)
 
 
@@ -106,12 +116,60 @@ def _filter_distinct(r, sentinel, eps):
     """Set all but one of matching adjacent elements in ``r``  to ``sentinel``."""
     # eps needs to be low enough that close distinct roots do not get removed.
     # Otherwise, algorithms relying on continuity will fail.
-    mask = jnp.isclose(jnp.diff(r, axis=-1, prepend=sentinel), 0, atol=eps)
+    mask = jnp.abs(jnp.diff(r, axis=-1, prepend=sentinel)) <= eps
     r = jnp.where(mask, sentinel, r)
     return r
 
 
-_roots = jnp.vectorize(partial(jnp.roots, strip_zeros=False), signature="(m)->(n)")
+@lru_cache
+def _companion_template(n):
+    """Return the constant part of the companion matrix of a degree ``n`` polynomial.
+
+    The subdiagonal of ones depends only on the degree, so it is built once
+    and reused for every batch of polynomials of that degree. The cached array
+    is read-only.
+    """
+    A = np.eye(n, k=-1)
+    A.flags.writeable = False
+    return A
+
+
+def _roots(c):
+    """Roots of polynomials from eigenvalues of their companion matrices.
+
+    Batched equivalent of ``jnp.roots(c, strip_zeros=False)`` over leading axes.
+
+    Parameters
+    ----------
+    c : jnp.ndarray
+        Last axis should store coefficients of a polynomial. For a polynomial given by
+        ∑ᵢⁿ cᵢ xⁱ, where n is ``c.shape[-1]-1``, coefficient cᵢ should be stored at
+        ``c[...,n-i]``.
+
+    Returns
+    -------
+    r : jnp.ndarray
+        Shape (..., c.shape[-1] - 1).
+        Complex roots of the polynomials.
+
+    """
+    n = c.shape[-1] - 1
+    if n < 1:
+        return jnp.zeros((*c.shape[:-1], 0), dtype=complex)
+    # Roll leading zeros to the end so that the companion matrix is well-defined.
+    # The zero roots this introduces are replaced by nan below.
+    is_zero = c == 0
+    num_zeros = jnp.where(is_zero.all(axis=-1), n + 1, jnp.argmin(is_zero, axis=-1))
+    c = jnp.where((num_zeros == n + 1)[..., jnp.newaxis], 1.0, c)
+    c = jnp.take_along_axis(
+        c, (jnp.arange(n + 1) + num_zeros[..., jnp.newaxis]) % (n + 1), axis=-1
+    )
+
+    A = jnp.broadcast_to(_companion_template(n), (*c.shape[:-1], n, n))
+    A = A.at[..., 0, :].set(-c[..., 1:] / c[..., :1])
+    r = jnp.linalg.eigvals(A)
+    r = jnp.take_along_axis(r, jnp.argsort(r == 0, axis=-1), axis=-1)
+    return jnp.where(jnp.arange(n) < n - num_zeros[..., jnp.newaxis], r, jnp.nan)
 
 
 def polyroot_vec(
@@ -184,11 +242,11 @@ def polyroot_vec(
     if get_only_real_roots:
         a_min = -jnp.inf if a_min is None else a_min[..., jnp.newaxis]
         a_max = +jnp.inf if a_max is None else a_max[..., jnp.newaxis]
-        r = jnp.where(
-            (jnp.abs(r.imag) <= eps) & (a_min <= r.real) & (r.real <= a_max),
-            r.real,
-            sentinel,
-        )
+        # Read the roots once to build the whole mask. The analytic formulae
+        # already return real roots, so skip the imaginary part check for those.
+        is_real = (jnp.abs(r.imag) <= eps) if jnp.iscomplexobj(r) else True
+        r = r.real
+        r = jnp.where(is_real & (a_min <= r) & (r <= a_max), r, sentinel)
 
     if sort or distinct:
         r = jnp.sort(r, axis=-1)
@@ -204,18 +262,13 @@ def _root_cubic(C, sentinel, eps, distinct):
     def irreducible(Q, R, b, mask):
         # Three irrational real roots.
         theta = R / jnp.sqrt(jnp.where(mask, Q**3, 1.0))
-        theta = jnp.arccos(jnp.where(jnp.abs(theta) < 1.0, theta, 0.0))
+        theta = jnp.arccos(jnp.where(jnp.abs(theta) < 1.0, theta, 0.0)) / 3
+        # cos(θ/3 ± 2π/3) = −cos(θ/3)/2 ∓ √3/2 sin(θ/3) by angle addition,
+        # so one sine and cosine evaluation gives all three roots.
+        cos = jnp.cos(theta)
+        sin = jnp.sqrt(3) / 2 * jnp.sin(theta)
         return jnp.moveaxis(
-            -2
-            * jnp.sqrt(Q)
-            * jnp.stack(
-                [
-                    jnp.cos(theta / 3),
-                    jnp.cos((theta + 2 * jnp.pi) / 3),
-                    jnp.cos((theta - 2 * jnp.pi) / 3),
-                ]
-            )
-            - b / 3,
+            -2 * jnp.sqrt(Q) * jnp.stack([cos, -cos / 2 - sin, -cos / 2 + sin]) - b / 3,
             source=0,
             destination=-1,
         )
@@ -1,5 +1,8 @@
 """Utilities for quadratures."""
 
+from functools import lru_cache
+
+import numpy as np
 from orthax.legendre import legder, legval
 
 from desc.backend import eigh_tridiagonal, jnp, put
@@ -184,6 +187,7 @@ def leggauss_lob(deg, interior_only=False):
     return x, w
 
 
+@lru_cache
 def uniform(deg):
     """Uniform quadrature that is Gauss-Chebyshev in transformed variable.
 
@@ -197,17 +201,46 @@ def uniform(deg):
 
     Returns
     -------
-    x, w : (jnp.ndarray, jnp.ndarray)
+    x, w : (np.ndarray, np.ndarray)
         Shape (deg, ).
-        Quadrature points and weights.
+        Quadrature points and weights. These are cached and shared between
+        callers, so they are read-only. Copy them before modifying in place.
 
     """
     # Define x = 2/π arcsin y and g : y ↦ f(x(y)).
     #   ∫₋₁¹ f(x) dx = 2/π ∫₋₁¹ (1−y²)⁻⁰ᐧ⁵ g(y) dy
     # ∑ₖ wₖ f(x(yₖ)) = 2/π ∑ₖ ωₖ g(yₖ)
     # Given roots yₖ of Chebyshev polynomial, x(yₖ) below is uniform in (-1, 1).
-    x = jnp.arange(-deg + 1, deg + 1, 2) / deg
-    w = 2 / deg * jnp.ones(deg)
+    # These depend only on the static ``deg``, so we cache them as NumPy arrays
+    # that are embedded as constants when traced rather than rebuilt each call.
+    x = np.arange(-deg + 1, deg + 1, 2) / deg
+    w = np.full(deg, 2 / deg)
+    x.flags.writeable = False
+    w.flags.writeable = False
+    return x, w
+
+
+def chebgauss1(deg):
+    """Gauss-Chebyshev quadrature of the first kind with implicit weighting.
+
+    Returns quadrature points xₖ and weights wₖ for the approximate evaluation
+    of the integral ∫₋₁¹ f(x) dx ≈ ∑ₖ wₖ f(xₖ) where f(x) = g(x) / √(1−x²).
+
+    Parameters
+    ----------
+    deg : int
+        Number of quadrature points.
+
+    Returns
+    -------
+    x, w : (jnp.ndarray, jnp.ndarray)
+        Shape (deg, ).
+        Quadrature points and weights.
+
+    """
+    t = 0.5 * jnp.arange(2 * deg - 1, 0, -2) * jnp.pi / deg
+    x = jnp.cos(t)
+    w = jnp.pi * jnp.abs(jnp.sin(t)) / deg
     return x, w
 
 
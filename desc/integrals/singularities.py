@@ -300,21 +300,10 @@ class DFTInterpolator(_BIESTInterpolator):
         A = basis.evaluate(source_grid.nodes)
         Ainv = jnp.linalg.pinv(A)
 
-        B = jnp.zeros((*theta_q.shape, basis.num_modes))
-
-        def body(i, B):
-            x = jnp.array(
-                [
-                    jnp.zeros_like(theta_q[i]),
-                    theta_q[i],
-                    zeta_q[i],
-                ]
-            ).T
-            Bi = basis.evaluate(jnp.atleast_2d(x))
-            B = put(B, i, Bi)
-            return B
-
-        B = fori_loop(0, B.shape[0], body, B)
+        # Evaluate the basis at all polar nodes of every eval point at once
+        # rather than building the transform matrix one row at a time.
+        x = jnp.column_stack([jnp.zeros(theta_q.size), theta_q.ravel(), zeta_q.ravel()])
+        B = basis.evaluate(x).reshape(*theta_q.shape, basis.num_modes)
         self._mat = B @ Ainv
 
     def __call__(self, f, i):
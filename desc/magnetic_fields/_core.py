@@ -1,5 +1,6 @@
 """Classes for magnetic fields."""
 
+import functools
 import warnings
 from abc import ABC, abstractmethod
 from collections.abc import MutableSequence
@@ -17,7 +18,7 @@ from diffrax import (
 from interpax import approx_df, interp1d, interp2d, interp3d
 from netCDF4 import Dataset, chartostring, stringtochar
 
-from desc.backend import fori_loop, jit, jnp, sign
+from desc.backend import fori_loop, jit, jnp, rsqrt, sign, vmap
 from desc.basis import (
     ChebyshevDoubleFourierBasis,
     ChebyshevPolynomial,
@@ -37,7 +38,51 @@ from desc.utils import copy_coeffs, errorif, flatten_list, setdefault, warnif
 from desc.vmec_utils import ptolemy_identity_fwd, ptolemy_identity_rev
 
 
-def biot_savart_general(re, rs, J, dV):
+def _sum_over_sources(kernel, re, rs, JdV, chunk_size):
+    """Sum kernel(re, rs, JdV) over chunks of source points.
+
+    Sources are passed to the kernel component-wise, with shape (3, chunk_size),
+    so the kernel works on contiguous x, y, z arrays instead of a trailing axis of 3.
+    """
+    pad = -rs.shape[0] % chunk_size
+    # Padded sources have zero current, so they contribute nothing.
+    rs = jnp.pad(rs, ((0, pad), (0, 0))).T.reshape(3, -1, chunk_size)
+    JdV = jnp.pad(JdV, ((0, pad), (0, 0))).T.reshape(3, -1, chunk_size)
+
+    def body(i, out):
+        return out + kernel(re, rs[:, i], JdV[:, i])
+
+    return fori_loop(0, rs.shape[1], body, jnp.zeros_like(re))
+
+
+def _inv_dist(r2, power):
+    """Return |r|^(-power) given r2 = |r|^2, or 0 where r = 0."""
+    mask = r2 > 0
+    # double where so the gradient is also zero rather than nan
+    return jnp.where(mask, rsqrt(jnp.where(mask, r2, 1)) ** power, 0)
+
+
+def _biot_savart_kernel(re, rs, JdV):
+    dx, dy, dz = re.T[:, :, jnp.newaxis] - rs[:, jnp.newaxis]
+    Jx, Jy, Jz = JdV
+    inv3 = _inv_dist(dx * dx + dy * dy + dz * dz, 3)
+    return jnp.stack(
+        [
+            ((Jy * dz - Jz * dy) * inv3).sum(axis=1),
+            ((Jz * dx - Jx * dz) * inv3).sum(axis=1),
+            ((Jx * dy - Jy * dx) * inv3).sum(axis=1),
+        ],
+        axis=-1,
+    )
+
+
+def _biot_savart_vector_potential_kernel(re, rs, JdV):
+    dx, dy, dz = re.T[:, :, jnp.newaxis] - rs[:, jnp.newaxis]
+    return _inv_dist(dx * dx + dy * dy + dz * dz, 1) @ JdV.T
+
+
+@functools.partial(jit, static_argnames=["chunk_size"])
+def biot_savart_general(re, rs, J, dV, chunk_size=32):
     """Biot-Savart law for arbitrary sources.
 
     Parameters
@@ -50,6 +95,9 @@ def biot_savart_general(re, rs, J, dV):
         current density vector at source points, in cartesian.
     dV : ndarray, shape(n_src_pts)
         volume element at source points
+    chunk_size : int
+        Number of source points to sum over at once. Memory usage scales as
+        n_eval_pts * chunk_size.
 
     Returns
     -------
@@ -59,19 +107,11 @@ def biot_savart_general(re, rs, J, dV):
     re, rs, J, dV = map(jnp.asarray, (re, rs, J, dV))
     assert J.shape == rs.shape
     JdV = J * dV[:, None]
-    B = jnp.zeros_like(re)
-
-    def body(i, B):
-        r = re - rs[i, :]
-        num = jnp.cross(JdV[i, :], r, axis=-1)
-        den = jnp.linalg.norm(r, axis=-1) ** 3
-        B = B + jnp.where(den[:, None] == 0, 0, num / den[:, None])
-        return B
-
-    return 1e-7 * fori_loop(0, J.shape[0], body, B)
+    return 1e-7 * _sum_over_sources(_biot_savart_kernel, re, rs, JdV, chunk_size)
 
 
-def biot_savart_general_vector_potential(re, rs, J, dV):
+@functools.partial(jit, static_argnames=["chunk_size"])
+def biot_savart_general_vector_potential(re, rs, J, dV, chunk_size=32):
     """Biot-Savart law for arbitrary sources for vector potential.
 
     Parameters
@@ -84,6 +124,9 @@ def biot_savart_general_vector_potential(re, rs, J, dV):
         current density vector at source points, in cartesian.
     dV : ndarray, shape(n_src_pts)
         volume element at source points
+    chunk_size : int
+        Number of source points to sum over at once. Memory usage scales as
+        n_eval_pts * chunk_size.
 
     Returns
     -------
@@ -93,16 +136,14 @@ def biot_savart_general_vector_potential(re, rs, J, dV):
     re, rs, J, dV = map(jnp.asarray, (re, rs, J, dV))
     assert J.shape == rs.shape
     JdV = J * dV[:, None]
-    A = jnp.zeros_like(re)
+    return 1e-7 * _sum_over_sources(
+        _biot_savart_vector_potential_kernel, re, rs, JdV, chunk_size
+    )
 
-    def body(i, A):
-        r = re - rs[i, :]
-        num = JdV[i, :]
-        den = jnp.linalg.norm(r, axis=-1)
-        A = A + jnp.where(den[:, None] == 0, 0, num / den[:, None])
-        return A
 
-    return 1e-7 * fori_loop(0, J.shape[0], body, A)
+def _curpol(eq):
+    """BNORM normalization curpol = 2π/NFP G(ρ=1) of an Equilibrium."""
+    return 2 * jnp.pi / eq.NFP * eq.compute("G", grid=LinearGrid(rho=jnp.array(1)))["G"]
 
 
 def read_BNORM_file(fname, surface, eval_grid=None, scale_by_curpol=True):
@@ -149,13 +190,9 @@ def read_BNORM_file(fname, surface, eval_grid=None, scale_by_curpol=True):
             "an Equilibrium must be supplied when scale_by_curpol is True!"
         )
 
-    curpol = (
-        (2 * jnp.pi / eq.NFP * eq.compute("G", grid=LinearGrid(rho=jnp.array(1)))["G"])
-        if scale_by_curpol
-        else 1
-    )
+    curpol = _curpol(eq) if scale_by_curpol else 1
 
-    data = np.genfromtxt(fname)
+    data = np.loadtxt(fname, ndmin=2)
 
     xm = data[:, 0]
     xn = -data[:, 1]  # negate since BNORM uses sin(mu+nv) convention
@@ -342,7 +379,7 @@ class _MagneticField(IOAble, ABC):
         B = self.compute_magnetic_field(
             coords, basis="rpz", source_grid=source_grid, params=params
         )
-        Bnorm = jnp.sum(B * surf_normal, axis=-1)
+        Bnorm = jnp.einsum("ij,ij->i", B, surf_normal)
 
         if calc_Bplasma:
             Bplasma = compute_B_plasma(eq, eval_grid, vc_source_grid, normal_only=True)
@@ -455,16 +492,7 @@ class _MagneticField(IOAble, ABC):
         # where bsubv is the extrapolation to the last full mesh point of
         # bsubvmnc."
         # this corresponds to 2pi/NFP*G(rho=1) in DESC
-        curpol = (
-            (
-                2
-                * jnp.pi
-                / surface.NFP
-                * eq.compute("G", grid=LinearGrid(rho=jnp.array(1)))["G"]
-            )
-            if scale_by_curpol
-            else 1
-        )
+        curpol = _curpol(eq) if scale_by_curpol else 1
 
         # BNORM assumes |B| has sin sym so c=0, so we only need s
         data = np.vstack((xm, Bnorm_xn, s * curpol)).T
@@ -1118,7 +1146,7 @@ class ToroidalMagneticField(_MagneticField, Optimizable):
             coords = xyz2rpz(coords)
         bp = B0 * R0 / coords[:, 0]
         brz = jnp.zeros_like(bp)
-        B = jnp.array([brz, bp, brz]).T
+        B = jnp.stack([brz, bp, brz], axis=-1)
         if basis == "xyz":
             B = rpz2xyz_vec(B, phi=coords[:, 1])
 
@@ -1161,7 +1189,7 @@ class ToroidalMagneticField(_MagneticField, Optimizable):
             coords = xyz2rpz(coords)
         az = -B0 * R0 * jnp.log(coords[:, 0])
         arp = jnp.zeros_like(az)
-        A = jnp.array([arp, arp, az]).T
+        A = jnp.stack([arp, arp, az], axis=-1)
         # b/c it only has a nonzero z component, no need
         # to switch bases back if xyz is given
         return A
@@ -1225,7 +1253,7 @@ class VerticalMagneticField(_MagneticField, Optimizable):
         coords = jnp.atleast_2d(jnp.asarray(coords))
         bz = B0 * jnp.ones_like(coords[:, 2])
         brp = jnp.zeros_like(bz)
-        B = jnp.array([brp, brp, bz]).T
+        B = jnp.stack([brp, brp, bz], axis=-1)
         # b/c it only has a nonzero z component, no need
         # to switch bases back if xyz is given
 
@@ -1273,7 +1301,7 @@ class VerticalMagneticField(_MagneticField, Optimizable):
         ay = -B0 / 2 * coords_xyz[:, 0]
 
         az = jnp.zeros_like(ax)
-        A = jnp.array([ax, ay, az]).T
+        A = jnp.stack([ax, ay, az], axis=-1)
         if basis == "rpz":
             A = xyz2rpz_vec(A, phi=coords_rpz[:, 1])
 
@@ -1383,7 +1411,7 @@ class PoloidalMagneticField(_MagneticField, Optimizable):
         bp = jnp.zeros_like(br)
         bz = r * jnp.cos(theta)
         bmag = B0 * iota / R0
-        B = bmag * jnp.array([br, bp, bz]).T
+        B = bmag * jnp.stack([br, bp, bz], axis=-1)
         if basis == "xyz":
             B = rpz2xyz_vec(B, phi=coords[:, 1])
 
@@ -1527,21 +1555,23 @@ class SplineMagneticField(_MagneticField, Optimizable):
         self._method = method
         self._extrap = extrap
 
-        self._derivs = {}
-        self._derivs["BR"] = self._approx_derivs(self._BR)
-        self._derivs["Bphi"] = self._approx_derivs(self._Bphi)
-        self._derivs["BZ"] = self._approx_derivs(self._BZ)
         if AR is not None and Aphi is not None and AZ is not None:
             AR, Aphi, AZ = map(_atleast_4d, (AR, Aphi, AZ))
             assert AR.shape == Aphi.shape == AZ.shape == shape
             self._AR = AR
             self._Aphi = Aphi
             self._AZ = AZ
-            self._derivs["AR"] = self._approx_derivs(self._AR)
-            self._derivs["Aphi"] = self._approx_derivs(self._Aphi)
-            self._derivs["AZ"] = self._approx_derivs(self._AZ)
         else:
             self._AR = self._Aphi = self._AZ = None
+        self._AB = self._stack_all_components()
+        self._derivs = self._approx_all_derivs()
+
+    def _set_up(self):
+        """Set things after loading."""
+        self._AB = self._stack_all_components()
+        # older versions stored derivatives separately for each component
+        if "BR" in self._derivs:
+            self._derivs = self._approx_all_derivs()
 
     @property
     def NFP(self):
@@ -1560,24 +1590,42 @@ class SplineMagneticField(_MagneticField, Optimizable):
         assert len(new) == len(self.currents)
         self._currents = new
 
+    def _stack_components(self, A_or_B):
+        # shape(NR,Nphi,NZ,3,Ngroups) so all components are interpolated together,
+        # or shape(NR,NZ,3,Ngroups) for axisymmetric fields
+        AB = jnp.stack(
+            [getattr(self, "_" + A_or_B + c) for c in ["R", "phi", "Z"]], axis=-2
+        )
+        return AB[:, 0] if self._axisym else AB
+
+    def _stack_all_components(self):
+        # stacked once here rather than on every evaluation of the field
+        AB = {"B": self._stack_components("B")}
+        if self._AR is not None:
+            AB["A"] = self._stack_components("A")
+        return AB
+
+    def _approx_all_derivs(self):
+        return {key: self._approx_derivs(val) for key, val in self._AB.items()}
+
     def _approx_derivs(self, Bi):
+        if self._axisym:
+            # axisymmetric fields are interpolated with interp2d in (R, Z), whose
+            # y derivatives are along Z, so no toroidal derivatives are needed
+            fx = approx_df(self._R, Bi, self._method, 0)
+            return {
+                "fx": fx,
+                "fy": approx_df(self._Z, Bi, self._method, 1),
+                "fxy": approx_df(self._Z, fx, self._method, 1),
+            }
         tempdict = {}
         tempdict["fx"] = approx_df(self._R, Bi, self._method, 0)
+        tempdict["fy"] = approx_df(self._phi, Bi, self._method, 1)
         tempdict["fz"] = approx_df(self._Z, Bi, self._method, 2)
+        tempdict["fxy"] = approx_df(self._phi, tempdict["fx"], self._method, 1)
         tempdict["fxz"] = approx_df(self._Z, tempdict["fx"], self._method, 2)
-        if self._axisym:
-            tempdict["fy"] = jnp.zeros_like(tempdict["fx"])
-            tempdict["fxy"] = jnp.zeros_like(tempdict["fx"])
-            tempdict["fyz"] = jnp.zeros_like(tempdict["fx"])
-            tempdict["fxyz"] = jnp.zeros_like(tempdict["fx"])
-        else:
-            tempdict["fy"] = approx_df(self._phi, Bi, self._method, 1)
-            tempdict["fxy"] = approx_df(self._phi, tempdict["fx"], self._method, 1)
-            tempdict["fyz"] = approx_df(self._Z, tempdict["fy"], self._method, 2)
-            tempdict["fxyz"] = approx_df(self._Z, tempdict["fxy"], self._method, 2)
-        if self._axisym:
-            for key, val in tempdict.items():
-                tempdict[key] = val[:, 0, :]
+        tempdict["fyz"] = approx_df(self._Z, tempdict["fy"], self._method, 2)
+        tempdict["fxyz"] = approx_df(self._Z, tempdict["fxy"], self._method, 2)
         return tempdict
 
     def _compute_A_or_B(
@@ -1632,100 +1680,38 @@ class SplineMagneticField(_MagneticField, Optimizable):
         if basis == "xyz":
             coords = xyz2rpz(coords)
         Rq, phiq, Zq = coords.T
-        if compute_A_or_B == "B":
-            A_or_B_R = self._BR
-            A_or_B_phi = self._Bphi
-            A_or_B_Z = self._BZ
-        elif compute_A_or_B == "A":
-            A_or_B_R = self._AR
-            A_or_B_phi = self._Aphi
-            A_or_B_Z = self._AZ
+        AB = self._AB[compute_A_or_B]
 
         if self._axisym:
-            ABRq = interp2d(
-                Rq,
-                Zq,
-                self._R,
-                self._Z,
-                A_or_B_R[:, 0, :],
-                self._method,
-                (0, 0),
-                self._extrap,
-                (None, None),
-                **self._derivs[compute_A_or_B + "R"],
-            )
-            ABphiq = interp2d(
-                Rq,
-                Zq,
-                self._R,
-                self._Z,
-                A_or_B_phi[:, 0, :],
-                self._method,
-                (0, 0),
-                self._extrap,
-                (None, None),
-                **self._derivs[compute_A_or_B + "phi"],
-            )
-            ABZq = interp2d(
+            AB = interp2d(
                 Rq,
                 Zq,
                 self._R,
                 self._Z,
-                A_or_B_Z[:, 0, :],
+                AB,
                 self._method,
                 (0, 0),
                 self._extrap,
                 (None, None),
-                **self._derivs[compute_A_or_B + "Z"],
+                **self._derivs[compute_A_or_B],
             )
-
         else:
-            ABRq = interp3d(
-                Rq,
-                phiq,
-                Zq,
-                self._R,
-                self._phi,
-                self._Z,
-                A_or_B_R,
-                self._method,
-                (0, 0, 0),
-                self._extrap,
-                (None, 2 * np.pi / self.NFP, None),
-                **self._derivs[compute_A_or_B + "R"],
-            )
-            ABphiq = interp3d(
-                Rq,
-                phiq,
-                Zq,
-                self._R,
-                self._phi,
-                self._Z,
-                A_or_B_phi,
-                self._method,
-                (0, 0, 0),
-                self._extrap,
-                (None, 2 * np.pi / self.NFP, None),
-                **self._derivs[compute_A_or_B + "phi"],
-            )
-            ABZq = interp3d(
+            AB = interp3d(
                 Rq,
                 phiq,
                 Zq,
                 self._R,
                 self._phi,
                 self._Z,
-                A_or_B_Z,
+                AB,
                 self._method,
                 (0, 0, 0),
                 self._extrap,
                 (None, 2 * np.pi / self.NFP, None),
-                **self._derivs[compute_A_or_B + "Z"],
+                **self._derivs[compute_A_or_B],
             )
-        # ABRq etc shape(nq, ngroups)
-        AB = jnp.stack([ABRq, ABphiq, ABZq], axis=1)
         # AB shape(nq, 3, ngroups)
-        AB = jnp.sum(AB * currents, axis=-1)
+        AB = AB @ currents
         if basis == "xyz":
             AB = rpz2xyz_vec(AB, phi=coords[:, 1])
         return AB
@@ -1825,42 +1811,23 @@ class SplineMagneticField(_MagneticField, Optimizable):
         Zgrid = np.linspace(Zmin, Zmax, jz)
         pgrid = 2.0 * np.pi / (nfp * kp) * np.arange(kp)
 
-        # sum magnetic fields from each coil
-        br = np.zeros([kp, jz, ir, nextcur])
-        bp = np.zeros([kp, jz, ir, nextcur])
-        bz = np.zeros([kp, jz, ir, nextcur])
-        for i in range(nextcur):
-            coil_id = "%03d" % (i + 1,)
-            br[:, :, :, i] += mgrid["br_" + coil_id][()]  # B_R radial magnetic field
-            bp[:, :, :, i] += mgrid["bp_" + coil_id][()]  # B_phi toroidal field (T)
-            bz[:, :, :, i] += mgrid["bz_" + coil_id][()]  # B_Z vertical magnetic field
-
-        # shift axes to correct order
-        br = np.moveaxis(br, (0, 1, 2), (1, 2, 0))
-        bp = np.moveaxis(bp, (0, 1, 2), (1, 2, 0))
-        bz = np.moveaxis(bz, (0, 1, 2), (1, 2, 0))
-
-        # sum magnetic vector potentials from each coil
-        ar = np.zeros([kp, jz, ir, nextcur])
-        ap = np.zeros([kp, jz, ir, nextcur])
-        az = np.zeros([kp, jz, ir, nextcur])
+        def read_groups(name):
+            # stack the field of each coil group along the last axis and shift
+            # (kp, jz, ir) -> (ir, kp, jz) in a single contiguous copy
+            A = np.stack(
+                [mgrid[name + "_%03d" % (i + 1,)][()] for i in range(nextcur)],
+                axis=-1,
+            )
+            return np.ascontiguousarray(A.transpose(2, 0, 1, 3), dtype=float)
+
+        br = read_groups("br")  # B_R radial magnetic field
+        bp = read_groups("bp")  # B_phi toroidal field (T)
+        bz = read_groups("bz")  # B_Z vertical magnetic field
+
         try:
-            for i in range(nextcur):
-                coil_id = "%03d" % (i + 1,)
-                ar[:, :, :, i] += mgrid["ar_" + coil_id][
-                    ()
-                ]  # A_R radial mag. vec. potential
-                ap[:, :, :, i] += mgrid["ap_" + coil_id][
-                    ()
-                ]  # A_phi toroidal mag. vec. potential
-                az[:, :, :, i] += mgrid["az_" + coil_id][
-                    ()
-                ]  # A_Z vertical mag. vec. potential
-
-            # shift axes to correct order
-            ar = np.moveaxis(ar, (0, 1, 2), (1, 2, 0))
-            ap = np.moveaxis(ap, (0, 1, 2), (1, 2, 0))
-            az = np.moveaxis(az, (0, 1, 2), (1, 2, 0))
+            ar = read_groups("ar")  # A_R radial mag. vec. potential
+            ap = read_groups("ap")  # A_phi toroidal mag. vec. potential
+            az = read_groups("az")  # A_Z vertical mag. vec. potential
         except IndexError:
             warnif(
                 True,
@@ -1898,10 +1865,12 @@ class SplineMagneticField(_MagneticField, Optimizable):
             Number of toroidal field periods.
 
         """
-        R, phi, Z = map(np.asarray, (R, phi, Z))
-        rr, pp, zz = np.meshgrid(R, phi, Z, indexing="ij")
-        shp = rr.shape
-        coords = np.array([rr.flatten(), pp.flatten(), zz.flatten()]).T
+        R, phi, Z = map(np.atleast_1d, (R, phi, Z))
+        shp = (R.size, phi.size, Z.size)
+        coords = np.stack(
+            np.broadcast_arrays(R[:, None, None], phi[None, :, None], Z[None, None, :]),
+            axis=-1,
+        ).reshape(-1, 3)
         BR, BP, BZ = field.compute_magnetic_field(coords, params, basis="rpz").T
         try:
             AR, AP, AZ = field.compute_magnetic_vector_potential(
@@ -1929,6 +1898,23 @@ class SplineMagneticField(_MagneticField, Optimizable):
         )
 
 
+def _scalar_potential_field(potential, coords, params, static_params=()):
+    params = {**params, **dict(static_params)}
+    fun = lambda x: potential(*x.T, **params)
+    # potential is pointwise, so a jvp along each unit direction gives the gradient.
+    # batching the 3 tangents shares the primal evaluation between them
+    tangents = jnp.broadcast_to(jnp.eye(3)[:, None, :], (3, *coords.shape))
+    br, bp, bz = vmap(lambda v: Derivative.compute_jvp(fun, 0, (v,), coords))(tangents)
+    return jnp.stack([br, bp / coords[:, 0], bz], axis=-1)
+
+
+# jitted once per potential function, so repeated evaluations of the same
+# field (eg inside field_line_integrate) reuse the compiled derivatives
+_scalar_potential_field_jit = jit(
+    _scalar_potential_field, static_argnames=["potential", "static_params"]
+)
+
+
 class ScalarPotentialField(_MagneticField):
     """Magnetic field due to a scalar magnetic potential in cylindrical coordinates.
 
@@ -1980,14 +1966,25 @@ class ScalarPotentialField(_MagneticField):
 
         if params is None:
             params = self._params
-        r, p, z = coords.T
-        funR = lambda x: self._potential(x, p, z, **params)
-        funP = lambda x: self._potential(r, x, z, **params)
-        funZ = lambda x: self._potential(r, p, x, **params)
-        br = Derivative.compute_jvp(funR, 0, (jnp.ones_like(r),), r)
-        bp = Derivative.compute_jvp(funP, 0, (jnp.ones_like(p),), p)
-        bz = Derivative.compute_jvp(funZ, 0, (jnp.ones_like(z),), z)
-        B = jnp.array([br, bp / r, bz]).T
+        # only arrays and numbers are traced, other parameters (strings, flags,
+        # objects) are passed as static arguments, or eagerly if not hashable
+        static_params = {
+            key: val
+            for key, val in params.items()
+            if isinstance(val, bool)
+            or not isinstance(val, (jnp.ndarray, np.ndarray, np.number, int, float))
+        }
+        try:
+            hash(tuple(static_params.items()))
+        except TypeError:
+            B = _scalar_potential_field(self._potential, coords, params)
+        else:
+            B = _scalar_potential_field_jit(
+                self._potential,
+                coords,
+                {key: val for key, val in params.items() if key not in static_params},
+                tuple(static_params.items()),
+            )
         if basis == "xyz":
             B = rpz2xyz_vec(B, phi=coords[:, 1])
         return B
@@ -2237,7 +2234,7 @@ def field_line_integrate(
     rshape = r0.shape
     r0 = r0.flatten()
     z0 = z0.flatten()
-    x0 = jnp.array([r0, phis[0] * jnp.ones_like(r0), z0]).T
+    x0 = jnp.stack([r0, phis[0] * jnp.ones_like(r0), z0], axis=-1)
 
     @jit
     def odefun(s, rpz, args):
@@ -2246,9 +2243,11 @@ def field_line_integrate(
         br, bp, bz = field.compute_magnetic_field(
             rpz, params, basis="rpz", source_grid=source_grid
         ).T
-        return jnp.array(
-            [r * br / bp * jnp.sign(bp), jnp.sign(bp), r * bz / bp * jnp.sign(bp)]
-        ).squeeze()
+        # d(R,Z)/dphi = r * B_(R,Z) / B_phi, integrated along the direction of B_phi.
+        # Where B_phi = 0 the field line has no toroidal parametrization, and the
+        # scale is nan (0/0) so the solver fails there rather than stepping to inf.
+        scale = r * jnp.sign(bp) / bp
+        return jnp.stack([br * scale, jnp.sign(bp), bz * scale]).squeeze()
 
     # diffrax parameters
 
@@ -2286,7 +2285,7 @@ def field_line_integrate(
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", message="unhashable type")
         warnings.filterwarnings("ignore", message="`diffrax.*discrete_terminating")
-        x = jnp.vectorize(intfun, signature="(k)->(n,k)")(x0)
+        x = vmap(intfun)(x0)
 
     x = jnp.where(jnp.isinf(x), jnp.nan, x)
     r = x[:, :, 0].squeeze().T.reshape((len(phis), *rshape))
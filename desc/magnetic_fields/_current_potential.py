@@ -1,8 +1,10 @@
 """Magnetic field due to sheet current on a winding surface."""
 
+import functools
+
 import numpy as np
 
-from desc.backend import fori_loop, jnp
+from desc.backend import fori_loop, jit, jnp
 from desc.basis import DoubleFourierSeries
 from desc.compute import rpz2xyz, rpz2xyz_vec, xyz2rpz_vec
 from desc.compute.utils import _compute as compute_fun
@@ -548,10 +550,12 @@ class FourierCurrentPotentialField(
             If True, non-symmetric modes will be truncated.
 
         """
-        M = M or self._M_Phi
-        N = N or self._M_Phi
-        NFP = NFP or self.NFP
-        sym_Phi = sym_Phi or self.sym_Phi
+        M = setdefault(M, self._M_Phi)
+        N = setdefault(N, self._N_Phi)
+        NFP = setdefault(NFP, self.NFP)
+        sym_Phi = setdefault(sym_Phi, self.sym_Phi)
+        if (M, N, NFP, sym_Phi) == (self._M_Phi, self._N_Phi, self.NFP, self.sym_Phi):
+            return
 
         Phi_modes_old = self.Phi_basis.modes
         self.Phi_basis.change_resolution(M=M, N=N, NFP=self.NFP, sym=sym_Phi)
@@ -812,33 +816,38 @@ def _compute_A_or_B_from_CurrentPotentialField(
             profiles={},
         )
 
-    _rs = data["x"]
-    _K = data["K"]
+    # surface element. the surface grid weights include a factor of NFP which is
+    # removed after the loop over NFP, as we account for it there
+    _dV = source_grid.weights * data["|e_theta x e_zeta|"]
+    B = _sum_over_field_periods(
+        op, coords, data["x"], data["K"], _dV, source_grid.nodes[:, 2], source_grid.NFP
+    )
+    if basis == "rpz":
+        B = xyz2rpz_vec(B, x=coords[:, 0], y=coords[:, 1])
+    return B
 
-    # surface element, must divide by NFP to remove the NFP multiple on the
-    # surface grid weights, as we account for that when doing the for loop
-    # over NFP
-    _dV = source_grid.weights * data["|e_theta x e_zeta|"] / source_grid.NFP
 
-    def nfp_loop(j, f):
-        # calculate (by rotating) rs, rs_t, rz_t
-        phi = (source_grid.nodes[:, 2] + j * 2 * jnp.pi / source_grid.NFP) % (
-            2 * jnp.pi
+@functools.partial(jit, static_argnames=["op", "NFP"])
+def _sum_over_field_periods(op, coords, rs, K, dV, zeta, NFP):
+    # jitted at module level so that repeated calls with the same shapes reuse the
+    # compiled loop instead of tracing a new closure each time
+    # convert to cartesian once. the other field periods are just rigid rotations
+    # about the Z axis (bc of discrete NFP symmetry)
+    rs = rpz2xyz(jnp.column_stack([rs[:, 0], zeta, rs[:, 2]]))
+    K = rpz2xyz_vec(K, phi=zeta)
+    alpha = 2 * jnp.pi * jnp.arange(NFP) / NFP
+    cos, sin = jnp.cos(alpha), jnp.sin(alpha)
+
+    def rotate(x, j):
+        return jnp.column_stack(
+            [
+                cos[j] * x[:, 0] - sin[j] * x[:, 1],
+                sin[j] * x[:, 0] + cos[j] * x[:, 1],
+                x[:, 2],
+            ]
         )
-        # new coords are just old R,Z at a new phi (bc of discrete NFP symmetry)
-        rs = jnp.vstack((_rs[:, 0], phi, _rs[:, 2])).T
-        rs = rpz2xyz(rs)
-        K = rpz2xyz_vec(_K, phi=phi)
-        fj = op(
-            coords,
-            rs,
-            K,
-            _dV,
-        )
-        f += fj
-        return f
 
-    B = fori_loop(0, source_grid.NFP, nfp_loop, jnp.zeros_like(coords))
-    if basis == "rpz":
-        B = xyz2rpz_vec(B, x=coords[:, 0], y=coords[:, 1])
-    return B
+    def nfp_loop(j, f):
+        return f + op(coords, rotate(rs, j), rotate(K, j), dV)
+
+    return fori_loop(0, NFP, nfp_loop, jnp.zeros_like(coords)) / NFP
@@ -5,7 +5,9 @@ https://doi.org/10.1016/0010-4655(86)90109-8
 
 """
 
-from desc.backend import cond, fori_loop, gammaln, jit, jnp
+import numpy as np
+
+from desc.backend import digamma, fori_loop, gammaln, jit, jnp
 from desc.derivatives import Derivative
 
 from ._core import ScalarPotentialField, _MagneticField
@@ -149,64 +151,33 @@ class DommaschkPotentialField(ScalarPotentialField):
         # this is not an issue right now
 
         # mode numbers
-        ms = []
-        ls = []
+        ls, ms = np.meshgrid(
+            np.arange(1, max_l + 1), np.arange(0, max_m * NFP + 1, NFP), indexing="ij"
+        )
+        ls, ms = ls.ravel(), ms.ravel()
+        n = ls.size  # how many l-m mode pairs there are
+        assert 4 * n == num_modes - 1
 
         # order of coeffs in the vector c are B0, a_ml, b_ml, c_ml, d_ml
-        a_s = []
-        b_s = []
-        c_s = []
-        d_s = []
-        zero_due_to_sym_inds = []
-        abcd_zero_due_to_sym_inds = [
-            [],
-            [],
-            [],
-            [],
-        ]  # indices that should be 0 due to symmetry
-        # if sym is True, when l is even then we need a=d=0
+        # mask of shape (4, n) which is 0 for coefficients that should be 0 due to
+        # symmetry. if sym is True, when l is even then we need a=d=0
         # and if l is odd then b=c=0
-
-        for l in range(1, max_l + 1):
-            for m in range(0, max_m * NFP + 1, NFP):
-                if not sym:
-                    pass  # no sym, use all coefs
-                elif l % 2 == 0:
-                    zero_due_to_sym_inds = [0, 3]  # a=d=0 for even l with sym
-                elif l % 2 == 1:
-                    zero_due_to_sym_inds = [1, 2]  # b=c=0 for odd l with sym
-                for which_coef in range(4):
-                    if which_coef == 0:
-                        a_s.append(1)
-                    elif which_coef == 1:
-                        b_s.append(1)
-                    elif which_coef == 2:
-                        c_s.append(1)
-                    elif which_coef == 3:
-                        d_s.append(1)
-                    if which_coef in zero_due_to_sym_inds:
-                        abcd_zero_due_to_sym_inds[which_coef].append(0)
-                    else:
-                        abcd_zero_due_to_sym_inds[which_coef].append(1)
-                ms.append(m)
-                ls.append(l)
-        for i in range(4):
-            abcd_zero_due_to_sym_inds[i] = jnp.asarray(abcd_zero_due_to_sym_inds[i])
-        assert (len(a_s) + len(b_s) + len(c_s) + len(d_s)) == num_modes - 1
+        abcd_zero_due_to_sym_inds = np.ones((4, n), dtype=int)
+        if sym:
+            even = ls % 2 == 0
+            abcd_zero_due_to_sym_inds[[0, 3]] = ~even
+            abcd_zero_due_to_sym_inds[[1, 2]] = even
+        abcd_zero_due_to_sym_inds = jnp.asarray(abcd_zero_due_to_sym_inds)
 
         params = {
             "ms": ms,
             "ls": ls,
-            "a_arr": a_s,
-            "b_arr": b_s,
-            "c_arr": c_s,
-            "d_arr": d_s,
+            "a_arr": np.ones(n),
+            "b_arr": np.ones(n),
+            "c_arr": np.ones(n),
+            "d_arr": np.ones(n),
             "B0": 0.0,
         }
-        n = (
-            round(num_modes - 1) / 4
-        )  # how many l-m mode pairs there are, also is len(a_s)
-        n = int(n)
         domm_field = DommaschkPotentialField(0, 0, 0, 0, 0, 0, 1)
 
         def get_B_dom(coords, X, ms, ls):
@@ -230,14 +201,12 @@ class DommaschkPotentialField(ScalarPotentialField):
                 },
             )
 
-        X = []
-        for key in ["B0", "a_arr", "b_arr", "c_arr", "d_arr"]:
-            obj = params[key]
-            if isinstance(obj, list):
-                X += obj
-            else:
-                X += [obj]
-        X = jnp.asarray(X)
+        X = jnp.concatenate(
+            [
+                jnp.atleast_1d(params[key])
+                for key in ["B0", "a_arr", "b_arr", "c_arr", "d_arr"]
+            ]
+        )
 
         jac = jit(Derivative(get_B_dom, argnum=1))(
             coords, X, params["ms"], params["ls"]
@@ -269,144 +238,120 @@ class DommaschkPotentialField(ScalarPotentialField):
         return cls(ms, ls, a_arr, b_arr, c_arr, d_arr, B0)
 
 
-true_fun = lambda m_n: 0.0  # used for returning 0 when conditionals evaluate to True
-
-
 @jit
 def gamma(n):
     """Gamma function, only implemented for integers (equiv to factorial of (n-1))."""
     return jnp.exp(gammaln(n))
 
 
+# The helpers below are zero outside their index range. They are evaluated with
+# the index clamped into range and then masked, rather than branching with cond,
+# so they stay elementwise when batched.
+
+
 @jit
 def alpha(m, n):
     """Alpha of eq 27, 1st ind comes from C_m_k, 2nd is the subscript of alpha."""
     # modified for eqns 31 and 32
-
-    def false_fun(m_n):
-        m, n = m_n
-        return (-1) ** n / (gamma(m + n + 1) * gamma(n + 1) * 2.0 ** (2 * n + m))
-
-    def bool_fun(n):
-        return n < 0
-
-    return cond(
-        bool_fun(n),
-        true_fun,
-        false_fun,
-        (
-            m,
-            n,
-        ),
-    )
+    mask = n < 0
+    n = jnp.where(mask, 0, n)
+    val = (-1) ** n / (gamma(m + n + 1) * gamma(n + 1) * 2.0 ** (2 * n + m))
+    return jnp.where(mask, 0.0, val)
 
 
 @jit
 def alphastar(m, n):
     """Alphastar of eq 27, 1st ind comes from C_m_k, 2nd is the subscript of alpha."""
-
-    def false_fun(m_n):  # modified for eqns 31 and 32
-        m, n = m_n
-        return (2 * n + m) * alpha(m, n)
-
-    return cond(n < 0, true_fun, false_fun, (m, n))
+    # modified for eqns 31 and 32
+    return jnp.where(n < 0, 0.0, (2 * n + m) * alpha(m, n))
 
 
 @jit
 def beta(m, n):
     """Beta of eq 28, modified for eqns 31 and 32."""
-
-    def false_fun(m_n):
-        m, n = m_n
-        return gamma(m - n) / (gamma(n + 1) * 2.0 ** (2 * n - m + 1))
-
-    return cond(jnp.logical_or(n < 0, n >= m), true_fun, false_fun, (m, n))
+    mask = jnp.logical_or(n < 0, n >= m)
+    n = jnp.where(mask, m - 1, n)
+    val = gamma(m - n) / (gamma(n + 1) * 2.0 ** (2 * n - m + 1))
+    return jnp.where(mask, 0.0, val)
 
 
 @jit
 def betastar(m, n):
     """Beta* of eq 28, modified for eqns 31 and 32."""
-
-    def false_fun(m_n):
-        m, n = m_n
-        return (2 * n - m) * beta(m, n)
-
-    return cond(jnp.logical_or(n < 0, n >= m), true_fun, false_fun, (m, n))
+    return jnp.where(jnp.logical_or(n < 0, n >= m), 0.0, (2 * n - m) * beta(m, n))
 
 
 @jit
 def gamma_n(m, n):
     """gamma_n of eq 33."""
-
-    def body_fun(i, val):
-        return val + 1 / i + 1 / (m + i)
-
-    def false_fun(m_n):
-        m, n = m_n
-        return alpha(m, n) / 2 * fori_loop(1, n, body_fun, 0)
-
-    return cond(n <= 0, true_fun, false_fun, (m, n))
+    mask = n <= 0
+    n = jnp.where(mask, 1, n)
+    # sum_{i=1}^{n-1} 1/i + 1/(m+i) in closed form
+    val = (
+        alpha(m, n) / 2 * (digamma(n) - digamma(1.0) + digamma(m + n) - digamma(m + 1))
+    )
+    return jnp.where(mask, 0.0, val)
 
 
 @jit
 def gamma_nstar(m, n):
     """gamma_n star of eq 33."""
-
-    def false_fun(m_n):
-        m, n = m_n
-        return (2 * n + m) * gamma_n(m, n)
-
-    return cond(n <= 0, true_fun, false_fun, (m, n))
+    return jnp.where(n <= 0, 0.0, (2 * n + m) * gamma_n(m, n))
 
 
 @jit
 def CD_m_k(R, m, k):
     """Eq 31 of Dommaschk paper."""
+    logR = jnp.log(R)
+    R2 = R**2
 
     def body_fun(j, val):
-        result = (
+        val, Rp, Rn = val  # R^(2j+m), R^(2j-m)
+        val = (
             val
             + (
                 -(
                     alpha(m, j)
                     * (
-                        alphastar(m, k - m - j) * jnp.log(R)
+                        alphastar(m, k - m - j) * logR
                         + gamma_nstar(m, k - m - j)
                         - alpha(m, k - m - j)
                     )
                     - gamma_n(m, j) * alphastar(m, k - m - j)
                     + alpha(m, j) * betastar(m, k - j)
                 )
-                * R ** (2 * j + m)
+                * Rp
             )
-            + beta(m, j) * alphastar(m, k - j) * R ** (2 * j - m)
+            + beta(m, j) * alphastar(m, k - j) * Rn
         )
-        return result
+        return val, Rp * R2, Rn * R2
 
-    return fori_loop(0, k + 1, body_fun, jnp.zeros_like(R))
+    return fori_loop(0, k + 1, body_fun, (jnp.zeros_like(R), R**m, R ** (-m)))[0]
 
 
 @jit
 def CN_m_k(R, m, k):
     """Eq 32 of Dommaschk paper."""
+    logR = jnp.log(R)
+    R2 = R**2
 
     def body_fun(j, val):
-        result = (
+        val, Rp, Rn = val  # R^(2j+m), R^(2j-m)
+        val = (
             val
             + (
                 (
-                    alpha(m, j)
-                    * (alpha(m, k - m - j) * jnp.log(R) + gamma_n(m, k - m - j))
+                    alpha(m, j) * (alpha(m, k - m - j) * logR + gamma_n(m, k - m - j))
                     - gamma_n(m, j) * alpha(m, k - m - j)
                     + alpha(m, j) * beta(m, k - j)
                 )
-                * R ** (2 * j + m)
+                * Rp
             )
-            - beta(m, j) * alpha(m, k - j) * R ** (2 * j - m)
+            - beta(m, j) * alpha(m, k - j) * Rn
         )
-        return result
+        return val, Rp * R2, Rn * R2
 
-    return fori_loop(0, k + 1, body_fun, jnp.zeros_like(R))
+    return fori_loop(0, k + 1, body_fun, (jnp.zeros_like(R), R**m, R ** (-m)))[0]
 
 
 @jit
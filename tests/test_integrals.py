@@ -6,7 +6,6 @@ import numpy as np
 import pytest
 from jax import grad
 from matplotlib import pyplot as plt
-from numpy.polynomial.chebyshev import chebgauss, chebweight
 from numpy.polynomial.legendre import leggauss
 from scipy import integrate
 from scipy.interpolate import CubicHermiteSpline
@@ -43,6 +42,7 @@ from desc.integrals.bounce_utils import (
 from desc.integrals.quad_utils import (
     automorphism_sin,
     bijection_from_disc,
+    chebgauss1,
     chebgauss2,
     get_quadrature,
     grad_automorphism_sin,
@@ -747,6 +747,19 @@ class TestBouncePoints:
         np.testing.assert_allclose(z1, intersect[0::2])
         np.testing.assert_allclose(z2, intersect[1::2])
 
+    @pytest.mark.unit
+    def test_num_well_larger_than_intersects(self):
+        """Test output is padded to num_well when it exceeds the intersect count."""
+        knots = np.linspace(np.pi / 3, 6 * np.pi, 5)
+        B = CubicHermiteSpline(knots, np.cos(knots), -np.sin(knots))
+        # at most M * (N - 1) * 3 = 12 intersects for a cubic spline with 5 knots
+        num_well = 20
+        z1, z2 = bounce_points(0.5, knots, B.c.T, B.derivative().c.T, num_well=num_well)
+        assert z1.shape == z2.shape == (1, num_well)
+        z1_all, z2_all = bounce_points(0.5, knots, B.c.T, B.derivative().c.T)
+        np.testing.assert_allclose(z1[..., : z1_all.shape[-1]], z1_all)
+        np.testing.assert_allclose(z2[..., : z2_all.shape[-1]], z2_all)
+
     @pytest.mark.unit
     def test_z2_first(self):
         """Case where straight line through first two intersects is in hypograph."""
@@ -893,12 +906,6 @@ class TestBouncePoints:
         np.testing.assert_allclose(B_ext[idx], B_ext_scipy)
 
 
-def _chebgauss1(deg):
-    x, w = chebgauss(deg)
-    w /= chebweight(x)
-    return x, w
-
-
 class TestBounceQuadrature:
     """Test bounce quadrature."""
 
@@ -912,7 +919,7 @@ class TestBounceQuadrature:
             (False, tanh_sinh(20), None),
             # Node density near boundary is 1/(1−x²).
             (True, leggauss(25), auto_sin),
-            (True, _chebgauss1(30), auto_sin),
+            (True, chebgauss1(30), auto_sin),
             # Lobatto nodes
             (False, leggauss_lob(8, interior_only=True), auto_sin),
             # Node density near boundary is 1/√(1−x²).
@@ -936,10 +943,10 @@ class TestBounceQuadrature:
         For the strongly singular bounce integrals, another √(1−x²) factor is preferred
         to supress the derivative (as expected from chain rule), so we need to use the
         sin automorphism. We choose to apply that map to ``leggauss`` instead of
-        ``_chebgauss1`` because the extra cosine term in ``_chebgauss1`` increases the
+        ``chebgauss1`` because the extra cosine term in ``chebgauss1`` increases the
         polynomial complexity of the integrand and suppresses the derivative too strong
         for a quadrature that already clusters near edge with density 1/(1−x²). This is
-        why ``_chebgauss1`` required more nodes in this test, and in general would
+        why ``chebgauss1`` required more nodes in this test, and in general would
         require more nodes for functions with more features.
 
         """
@@ -1159,6 +1166,53 @@ class TestBounce1D:
         fig, ax = bounce.plot(m, l, pitch_inv[l], include_legend=False, show=False)
         return fig
 
+    @staticmethod
+    def _example_bounce():
+        eq = get("HELIOTRON")
+        grid = get_rtz_grid(
+            eq,
+            np.array([0.5, 1]),
+            np.array([0]),
+            np.linspace(-2 * np.pi, 2 * np.pi, 100),
+            coordinates="raz",
+        )
+        data = eq.compute(
+            Bounce1D.required_names + ["min_tz |B|", "max_tz |B|", "g_zz"], grid=grid
+        )
+        bounce = Bounce1D(grid.source_grid, data, quad=leggauss(3))
+        pitch_inv, _ = bounce.get_pitch_inv_quad(
+            min_B=grid.compress(data["min_tz |B|"]),
+            max_B=grid.compress(data["max_tz |B|"]),
+            num_pitch=10,
+        )
+        g_zz = Bounce1D.reshape_data(grid.source_grid, data["g_zz"])
+        return bounce, pitch_inv, g_zz
+
+    @pytest.mark.unit
+    def test_bounce1d_pitch_chunk(self):
+        """Test that looping over chunks of pitch angles gives the same result."""
+        bounce, pitch_inv, g_zz = TestBounce1D._example_bounce()
+        points = bounce.points(pitch_inv)
+
+        def fun(pitch_inv, g_zz, pitch_chunk):
+            return bounce.integrate(
+                integrand=TestBounce1D._example_numerator,
+                pitch_inv=pitch_inv,
+                f=g_zz,
+                points=points,
+                pitch_chunk=pitch_chunk,
+            ).sum()
+
+        # 3 does not divide num_pitch = 10, so the last chunk is padded
+        np.testing.assert_allclose(
+            fun(pitch_inv, g_zz, 3), fun(pitch_inv, g_zz, None), rtol=1e-12
+        )
+        grad_chunk = grad(fun, argnums=(0, 1))(pitch_inv, g_zz, 3)
+        grad_full = grad(fun, argnums=(0, 1))(pitch_inv, g_zz, None)
+        for g_chunk, g_full in zip(grad_chunk, grad_full):
+            assert np.isfinite(g_chunk).all()
+            np.testing.assert_allclose(g_chunk, g_full, rtol=1e-10, atol=1e-14)
+
     @pytest.mark.unit
     @pytest.mark.parametrize("func", [interp_to_argmin, interp_to_argmin_hard])
     def test_interp_to_argmin(self, func):
@@ -238,6 +238,37 @@ class TestMagneticFields:
             field.compute_magnetic_field([1.0, np.pi / 4, 0]), [[0, 1, 0]]
         )
 
+    @pytest.mark.unit
+    def test_scalar_field_non_array_params(self):
+        """Test scalar potential field with parameters that are not arrays."""
+
+        def potential(R, phi, Z, B0, direction, scale=None, offsets=()):
+            B0 = B0 if scale is None else scale * B0
+            if direction == "toroidal":
+                return B0 * phi + sum(offsets)
+            return B0 * Z + sum(offsets)
+
+        field = ScalarPotentialField(
+            potential, {"B0": 2.0, "direction": "toroidal", "scale": None}
+        )
+        np.testing.assert_allclose(
+            field.compute_magnetic_field([2.0, 0, 0]), [[0, 1, 0]]
+        )
+        np.testing.assert_allclose(
+            field.compute_magnetic_field(
+                [2.0, 0, 0], params={"B0": 2.0, "direction": "vertical", "scale": 3}
+            ),
+            [[0, 0, 6]],
+        )
+        # unhashable parameters are evaluated without jit
+        np.testing.assert_allclose(
+            field.compute_magnetic_field(
+                [2.0, 0, 0],
+                params={"B0": 2.0, "direction": "vertical", "offsets": [1.0, 2.0]},
+            ),
+            [[0, 0, 2]],
+        )
+
     @pytest.mark.unit
     def test_current_potential_field(self):
         """Test current potential magnetic field against analytic result."""
@@ -868,6 +899,17 @@ class TestMagneticFields:
         np.testing.assert_allclose(field.Phi_basis.modes, basis.modes)
         assert field.Phi_basis.sym == "sin"
 
+        # only changing M should keep the current N
+        field.change_Phi_resolution(M=4, N=2)
+        M = 5
+        N = 2
+        basis = DoubleFourierSeries(M=M, N=N, NFP=surface.NFP, sym="sin")
+        field.change_Phi_resolution(M=M)
+
+        assert field.M_Phi == M
+        assert field.N_Phi == N
+        np.testing.assert_allclose(field.Phi_basis.modes, basis.modes)
+
     @pytest.mark.unit
     def test_init_Phi_mn_fourier_current_field(self):
         """Test initial Phi_mn size is correct for FourierCurrentPotentialField."""
@@ -1025,6 +1067,21 @@ class TestMagneticFields:
         with pytest.raises(ValueError, match="no vector potential"):
             field.compute_magnetic_vector_potential(np.array([1.75, 0.0, 0.0]))
 
+    @pytest.mark.unit
+    def test_spline_field_axisym_derivatives(self):
+        """Test axisymmetric SplineMagneticField uses derivatives in R and Z."""
+        # cubic spline should be exact for a field linear in R and Z
+        field = PoloidalMagneticField(1, 1, 0.5)
+        R = np.linspace(0.5, 1.5, 11)
+        Z = np.linspace(-0.5, 0.5, 11)
+        spline = SplineMagneticField.from_field(field, R, np.array([0.0]), Z)
+        coords = np.array([[0.73, 0.2, 0.31], [1.27, 2.0, -0.18]])
+        np.testing.assert_allclose(
+            spline.compute_magnetic_field(coords),
+            field.compute_magnetic_field(coords),
+            atol=1e-12,
+        )
+
     @pytest.mark.unit
     def test_field_line_integrate(self):
         """Test field line integration."""
@@ -13,6 +13,7 @@ from desc.integrals.quad_utils import (
     automorphism_sin,
     bijection_from_disc,
     bijection_to_disc,
+    chebgauss1,
     chebgauss2,
     grad_automorphism_arcsin,
     grad_automorphism_sin,
@@ -111,6 +112,9 @@ def test_chebgauss():
         f(automorphism_sin(x)).dot(w),
         2 / jnp.pi * scipy.integrate.quad(lambda y: f(y) / np.sqrt(1 - y**2), -1, 1)[0],
     )
+    x, w = chebgauss(deg)
+    w /= chebweight(x)
+    np.testing.assert_allclose(chebgauss1(deg), (x[::-1], w[::-1]))
     x, w = roots_chebyu(deg)
     w *= chebweight(x)
     np.testing.assert_allclose(chebgauss2(deg), (x, w))